@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date
 
 
 def generate_profile(age: int):
@@ -18,7 +18,7 @@ user_name = input('Enter your full name: ')
 birth_year_str = input('Enter your birth year: ')
 
 birth_year = int(birth_year_str)
-current_age = datetime.now().year - birth_year
+current_age = date.today().year - birth_year
 
 hobbies = []
 
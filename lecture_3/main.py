@@ -1,17 +1,49 @@
 '''Students grade manager'''
-from typing import Any, Set
-from re import split
-
-# List of dictionaries representing students
-students: list[dict[str, Any]] = []
+from typing import Any, Callable
+from fractions import Fraction
+import re
+import sys
+
+# Precompiled pattern for splitting grades input by delimiters
+GRADE_SPLIT_RE: re.Pattern = re.compile(r'[,;\s]+')
+
+# Main menu text, written at once instead of a separate print call per line
+MENU: str = (
+    '\n--- Student Grade Analyzer ---\n'
+    '1. Add a new student\n'
+    '2. Add grades for a student\n'
+    '3. Generate a full report\n'
+    '4. Find the top student\n'
+    '5. Exit program\n'
+    'Enter your choice: '
+)
+
+# Dictionary of students keyed by name for fast lookup (O(1) complexity)
+students: dict[str, dict[str, Any]] = {}
+
+# Summary of students' average grades, updated on every grades input,
+# so reports don't need to pass through all the students.
+# The sum is kept as a Fraction, so replacing averages in it doesn't accumulate float errors
+averages_summary: dict[str, Any] = {
+    'top_name': None, 'bottom_name': None, 'average_sum': Fraction(0), 'graded_count': 0
+}
+
+
+def read_line(prompt: str) -> str:
+    '''
+    This function displays a prompt and reads a line from stdin.
+    Unlike input(), it flushes stdout only once and doesn't touch stderr.
+    Returns an empty string at the end of input
+    '''
 
-# Set for fast student lookup by name, used where the task doesn't restrict its use
-student_index: Set[str] = set()
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline()
 
 
 def add_student() -> None:
     '''
-    This function prompts the user to enter a new student's name and adds it to the students list
+    This function prompts the user to enter a new student's name and adds it to the students dict
     Validates name input: only alphabetic characters are allowed.
     Input is normalized (converted to Title Case and side whitespace is removed)
     '''
@@ -22,15 +54,15 @@ def add_student() -> None:
         print('Name should be not empty and contain only alphabetic characters')
         return
 
-    # Check if student exists in index (O(1) complexity). If student already exists - don't add
-    if name in student_index:
+    # Check if student exists (O(1) complexity). If student already exists - don't add
+    if name in students:
         print('Student with this name already exists')
         return
 
-    # Add student to students list and add their name to student_index
-    new_student = {'name': name, 'grades': [], 'average': None}
-    students.append(new_student)
-    student_index.add(new_student['name'])
+    # Add student to students dict under their name
+    students[name] = {
+        'name': name, 'grades': [], 'grade_sum': 0, 'grade_count': 0, 'average': None
+    }
 
 
 def add_student_grade() -> None:
@@ -53,8 +85,8 @@ def add_student_grade() -> None:
     student_name: str = input('Enter student name: ').title().strip()
     found_student: dict | None = None
 
-    # Perform linear search through students bypassing student_index per task requirements
-    for student in students:
+    # Perform linear search through students bypassing the dict key lookup per task requirements
+    for student in students.values():
         if student['name'] == student_name:
             found_student = student
             break
@@ -68,15 +100,21 @@ def add_student_grade() -> None:
     while True:
         done_entered: bool = False
 
-        # Accept user input, normalize and split it by delimiters
-        grades_input: list[str] = split(
-            r'[,;\s]+', input('Enter a grade (or \'done\' to finish): ').strip().lower()
-        )
+        # Accept user input. Stop the function if input has ended
+        line: str = read_line('Enter a grade (or \'done\' to finish): ')
+        if not line:
+            break
 
-        # If 'done' is among the elements, trim the list including the found string itself
-        if grades_input.count('done'):
-            grades_input = grades_input[:grades_input.index('done')]
+        # Normalize input and split it by delimiters
+        grades_input: list[str] = GRADE_SPLIT_RE.split(line.strip().lower())
 
+        # If 'done' is among the elements, trim the list including the found string itself.
+        # A single index() call both checks presence and finds position in one pass
+        try:
+            grades_input = grades_input[:grades_input.index('done')]
+        except ValueError:
+            pass
+        else:
             # Mark that the function should stop at the end of input processing
             done_entered = True
 
@@ -84,30 +122,75 @@ def add_student_grade() -> None:
             if not grades_input:
                 break
 
-        # Start the loop through list to validate its elements
-        for grade in grades_input:
-            # Try to convert element to int. Loop will break on failure
-            try:
-                grade = int(grade)
-            except ValueError:
-                print('Enter a valid integer number')
-                break
+        # Convert all elements to int in a single pass. Request input again on failure
+        try:
+            parsed_grades: list[int] = [int(grade) for grade in grades_input]
+        except ValueError:
+            print('Enter a valid integer number')
+            continue
 
-            # Check that grade is in range [0, 100], otherwise break the loop
-            if grade < 0 or grade > 100:
-                print('Enter an integer number betweet 0 and 100')
-                break
-        else:
-            # If the validation loop wasn't broken, add all grades to student
-            for grade in grades_input:
-                found_student['grades'].append(int(grade))
+        # Check that all grades are in range [0, 100], otherwise request input again
+        if any(grade < 0 or grade > 100 for grade in parsed_grades):
+            print('Enter an integer number betweet 0 and 100')
+            continue
 
-            # Calculate student's average grade including new grades and record the result
-            found_student['average'] = (sum(found_student['grades'])/len(found_student['grades']))
+        # If validation passed, add all grades to student
+        found_student['grades'].extend(parsed_grades)
 
-            # If 'done' was entered, stop function execution
-            if done_entered:
-                break
+        # Update running sum and count instead of summing the whole grades list again
+        found_student['grade_sum'] += sum(parsed_grades)
+        found_student['grade_count'] += len(parsed_grades)
+
+        # Calculate student's average grade including new grades and record the result
+        old_average: float | None = found_student['average']
+        found_student['average'] = found_student['grade_sum']/found_student['grade_count']
+
+        # Reflect the new average in the summary of all students' averages
+        update_averages_summary(found_student, old_average)
+
+        # If 'done' was entered, stop function execution
+        if done_entered:
+            break
+
+
+def update_averages_summary(student: dict, old_average: float | None) -> None:
+    '''
+    This function updates the averages summary after the student's average has changed.
+    Students with the highest and the lowest average are looked up through all the students
+    only if the current one of them has moved away from the extreme
+    '''
+
+    new_average: float = student['average']
+
+    # Replace the student's previous average in the running sum
+    averages_summary['average_sum'] += Fraction(new_average)
+    if old_average is None:
+        averages_summary['graded_count'] += 1
+    else:
+        averages_summary['average_sum'] -= Fraction(old_average)
+
+    name: str = student['name']
+
+    # On a tie the full lookup keeps the first added student as the top one
+    top_name: str | None = averages_summary['top_name']
+    if top_name is None or new_average > students[top_name]['average']:
+        averages_summary['top_name'] = name
+    elif (top_name == name and new_average < old_average) or (
+        top_name != name and new_average == students[top_name]['average']
+    ):
+        averages_summary['top_name'] = max(
+            (graded for graded in students.values() if graded['average'] is not None),
+            key=lambda graded: graded['average']
+        )['name']
+
+    bottom_name: str | None = averages_summary['bottom_name']
+    if bottom_name is None or new_average < students[bottom_name]['average']:
+        averages_summary['bottom_name'] = name
+    elif bottom_name == name and new_average > old_average:
+        averages_summary['bottom_name'] = min(
+            (graded for graded in students.values() if graded['average'] is not None),
+            key=lambda graded: graded['average']
+        )['name']
 
 
 def get_report() -> None:
@@ -117,33 +200,23 @@ def get_report() -> None:
     among all students who have at least one grade
     '''
 
-    # List to store students' average grades
-    average_list: list[float] = []
-
     print('--- Student Report ---')
 
-    # Iterate through students list
-    for student in students:
-        try:
-            # Try to calculate average grade. We could use the pre-calculated
-            # student['average'], but the task requires this specific way of getting the average
-            average: str | int = sum(student['grades'])/len(student['grades'])
-
-            # Add an average grade to the list
-            average_list.append(average)
-
-            # Formating grade with a limit of one decimal place
+    # Iterate through students
+    for student in students.values():
+        if student['average'] is not None:
+            # Formating pre-calculated average grade with a limit of one decimal place
             # This is the fastest formatting method, ~25% faster than round
-            average = f'{average:.1f}'
+            average: str = f'{student["average"]:.1f}'
 
-        except ZeroDivisionError:
-            # In case of ZeroDivisionError, record status indicating no grade
+        else:
+            # If student has no grades, record status indicating no grade
             average: str = 'N/A'
 
         print(f'{student["name"]}\'s average grade is {average}.')
 
 
-    if len(average_list) == 0:
+    if averages_summary['graded_count'] == 0:
         if len(students) == 0:
             # Display a message about absence of students
             print('There is no students')
@@ -154,9 +227,12 @@ def get_report() -> None:
     else:
         # Output average grades for all the students
         print('--------------------------')
-        print(f'Max Average: {max(average_list):.1f}')
-        print(f'Min Average: {min(average_list):.1f}')
-        print(f'Overall Average: {(sum(average_list)/len(average_list)):.1f}')
+        overall_average: float = float(
+            averages_summary['average_sum']/averages_summary['graded_count']
+        )
+        print(f'Max Average: {students[averages_summary["top_name"]]["average"]:.1f}')
+        print(f'Min Average: {students[averages_summary["bottom_name"]]["average"]:.1f}')
+        print(f'Overall Average: {overall_average:.1f}')
 
 
 def get_top_performer() -> None:
@@ -165,15 +241,9 @@ def get_top_performer() -> None:
     and displays a message about him.
     '''
 
-    # Create a filtered list of students where each student has an average grade
-    graded_students: list[dict] = list(
-        filter(lambda student: student['average'] is not None, students)
-    )
-
-    # Select a student with the highest average grade. Returns None if students list is empty
-    top_performer: dict | None = max(
-        graded_students, default=None, key=lambda student: student['average']
-    )
+    # Take a student with the highest average grade from the summary. None if nobody has grades
+    top_name: str | None = averages_summary['top_name']
+    top_performer: dict | None = None if top_name is None else students[top_name]
 
     # Display an appropriate message
     if top_performer is None:
@@ -185,32 +255,35 @@ def get_top_performer() -> None:
         )
 
 
+# Menu items mapped to their handlers, so a choice is dispatched with a single lookup
+ACTIONS: dict[str, Callable[[], None]] = {
+    '1': add_student,
+    '2': add_student_grade,
+    '3': get_report,
+    '4': get_top_performer,
+}
+
 # The main program loop
 while True:
-    print('\n--- Student Grade Analyzer ---')
-    print('1. Add a new student')
-    print('2. Add grades for a student')
-    print('3. Generate a full report')
-    print('4. Find the top student')
-    print('5. Exit program')
-
-    # Request normalized a menu item input. The ValueError handling is not required here because
+    # Display the menu and request a menu item input. Stop the program if input has ended
+    menu_line: str = read_line(MENU)
+    if not menu_line:
+        break
+
+    # Normalize a menu item input. The ValueError handling is not required here because
     # I don't convert input to int
-    user_input: str = input('Enter your choice: ').strip()
-
-    # Match an entered string with one of the possible menu items
-    if user_input == '1':
-        add_student()
-    elif user_input == '2':
-        add_student_grade()
-    elif user_input == '3':
-        get_report()
-    elif user_input == '4':
-        get_top_performer()
-    elif user_input == '5':
-        # This menu item stops the program loop
+    user_input: str = menu_line.strip()
+
+    # This menu item stops the program loop
+    if user_input == '5':
         print('Exiting program.')
         break
-    else:
+
+    # Find a handler for an entered menu item
+    action: Callable[[], None] | None = ACTIONS.get(user_input)
+
+    if action is None:
         # If no matching menu item was found for the input, display a message about it
         print('Invalid choice. Please enter a number between 1 and 5.')
+    else:
+        action()
@@ -1,14 +1,17 @@
 """This module provides service layer for database operations on books."""
 
-from sqlalchemy import Sequence, select
-from sqlalchemy.sql.elements import OperatorExpression
+from sqlalchemy import ColumnElement, RowMapping, Sequence, delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
-from api.models import Book
+from api.models import Book, books_fts
 from api.schemas import BookSchema, PaginationQuery, SearchBookQuery
 
 
-class BookDoesNotExistException(BaseException):
+# Columns selected by read-only list queries, so rows aren't hydrated into Book instances
+BOOK_COLUMNS = (Book.id, Book.title, Book.author, Book.year)
+
+
+class BookDoesNotExistException(Exception):
     """Exception raised when a book does not exist in the database."""
 
 
@@ -20,11 +23,17 @@ class BookService:
 
     def build_search_query(
         self, search_text: str, column: InstrumentedAttribute[str]
-    ) -> OperatorExpression:
+    ) -> ColumnElement[bool]:
         """Build a search query for partial text matching.
 
-        Creates a query that matches the full search text and individual words
-        against a specified column using SQL LIKE operator.
+        Creates a query that matches individual words of the search text against
+        a specified column using SQL LIKE operator. The full text isn't matched
+        separately, because any row containing it also contains each of its words.
+        Each word of at least three characters is matched on the trigram FTS index
+        in its own subquery, because FTS5 can't use the index for an OR of LIKEs.
+        Shorter words can't use the index, so they are matched on the column itself.
+        So are words with ``%`` or ``_`` in them: the trigram LIKE misses matches
+        when the non-ASCII text around such a wildcard is shorter than a trigram.
 
         Args:
             search_text: The text to search for.
@@ -33,18 +42,32 @@ class BookService:
         Returns:
             A SQLAlchemy query expression for partial matching.
         """
-        subquery = column.like(f"%{search_text}%")
+        fts_column = books_fts.c[column.key]
 
+        # Keep unique words only, so the same LIKE isn't evaluated twice
         search_words_list = search_text.split(" ")
+        search_words = dict.fromkeys(word for word in search_words_list if word)
+
+        conditions = []
+        for word in search_words:
+            pattern = f"%{word}%"
 
-        for search_word in search_words_list:
-            subquery |= column.like(f"%{search_word}%")
+            # Trigram LIKE can't match words shorter than a trigram, nor reliably
+            # match wildcards next to non-ASCII text, so fall back to plain LIKE
+            if len(word) < 3 or "%" in word or "_" in word:
+                conditions.append(column.like(pattern))
+            else:
+                fts_query = select(books_fts.c.rowid).where(fts_column.like(pattern))
+                conditions.append(Book.id.in_(fts_query))
 
-        return subquery
+        if len(conditions) == 1:
+            return conditions[0]
+
+        return or_(*conditions)
 
     async def get(
         self, session: AsyncSession, pagination: PaginationQuery
-    ) -> Sequence[Book]:
+    ) -> Sequence[RowMapping]:
         """Get a paginated list of books.
 
         Args:
@@ -52,14 +75,17 @@ class BookService:
             pagination: Pagination parameters (cursor and limit).
 
         Returns:
-            A sequence of Book objects.
+            A sequence of book rows as mappings.
         """
-        query = select(Book).order_by(Book.id).limit(pagination.limit)
+        query = select(*BOOK_COLUMNS)
 
+        # Keyset pagination: a range scan over the primary key from the cursor
         if pagination.cursor:
             query = query.where(Book.id > pagination.cursor)
 
-        books = (await session.scalars(query)).all()
+        query = query.order_by(Book.id).limit(pagination.limit)
+
+        books = (await session.execute(query)).mappings().all()
 
         return books
 
@@ -68,7 +94,7 @@ class BookService:
         session: AsyncSession,
         search_params: SearchBookQuery,
         pagination: PaginationQuery,
-    ) -> Sequence[Book]:
+    ) -> Sequence[RowMapping]:
         """Search for books by title, author, or year with pagination.
 
         Supports partial matching for title and author fields.
@@ -79,27 +105,32 @@ class BookService:
             pagination: Pagination parameters (cursor and limit).
 
         Returns:
-            A sequence of matching Book objects.
+            A sequence of matching book rows as mappings.
         """
-        query = select(Book)
+        # Collect all the filters, so the query is built with a single where() call
+        filters = []
 
         if search_params.title is not None:
-            subquery = self.build_search_query(search_params.title, Book.title)
-            query = query.where(subquery)
+            filters.append(self.build_search_query(search_params.title, Book.title))
 
         if search_params.author is not None:
-            subquery = self.build_search_query(search_params.author, Book.author)
-            query = query.where(subquery)
+            filters.append(self.build_search_query(search_params.author, Book.author))
 
         if search_params.year is not None:
-            query = query.where(Book.year == search_params.year)
-
-        query = query.limit(pagination.limit)
+            filters.append(Book.year == search_params.year)
 
         if pagination.cursor:
-            query = query.where(Book.id > pagination.cursor)
+            filters.append(Book.id > pagination.cursor)
+
+        # Order by id, so the cursor gives a stable keyset pagination
+        query = (
+            select(*BOOK_COLUMNS)
+            .where(*filters)
+            .order_by(Book.id)
+            .limit(pagination.limit)
+        )
 
-        books = (await session.scalars(query)).all()
+        books = (await session.execute(query)).mappings().all()
 
         return books
 
@@ -117,7 +148,6 @@ class BookService:
 
         session.add(book)
         await session.commit()
-        await session.refresh(book)
 
         return book
 
@@ -137,17 +167,35 @@ class BookService:
         Raises:
             BookDoesNotExistException: If the book with given ID does not exist.
         """
-        book = await session.get(Book, book_id)
+        # SQLite before 3.35 has no RETURNING, so the book is loaded and changed instead
+        if not session.bind.dialect.update_returning:
+            book = await session.get(Book, book_id)
+
+            if book is None:
+                raise BookDoesNotExistException
+
+            book.title = payload.title
+            book.author = payload.author
+            book.year = payload.year
+
+            await session.commit()
+
+            return book
+
+        # Update and fetch the book with a single UPDATE ... RETURNING statement
+        query = (
+            update(Book)
+            .where(Book.id == book_id)
+            .values(title=payload.title, author=payload.author, year=payload.year)
+            .returning(Book)
+        )
+
+        book = (await session.scalars(query)).one_or_none()
 
         if book is None:
             raise BookDoesNotExistException
 
-        book.title = payload.title
-        book.author = payload.author
-        book.year = payload.year
-
         await session.commit()
-        await session.refresh(book)
 
         return book
 
@@ -161,12 +209,26 @@ class BookService:
         Raises:
             BookDoesNotExistException: If the book with given ID does not exist.
         """
-        book = await session.get(Book, book_id)
+        # SQLite before 3.35 has no RETURNING, so the book is loaded and deleted instead
+        if not session.bind.dialect.delete_returning:
+            book = await session.get(Book, book_id)
 
-        if book is None:
+            if book is None:
+                raise BookDoesNotExistException
+
+            await session.delete(book)
+            await session.commit()
+
+            return
+
+        # Delete the book with a single DELETE ... RETURNING statement
+        query = delete(Book).where(Book.id == book_id).returning(Book.id)
+
+        deleted_id = (await session.execute(query)).scalar_one_or_none()
+
+        if deleted_id is None:
             raise BookDoesNotExistException
 
-        await session.delete(book)
         await session.commit()
 
 
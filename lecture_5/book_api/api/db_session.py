@@ -0,0 +1,49 @@
+"""Database session scope module.
+
+This module provides ASGI middleware that opens one database session per request
+and stores it in a context variable, so endpoints get it without FastAPI dependencies.
+"""
+
+from contextvars import ContextVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Receive, Scope, Send
+from db_config import Session
+
+_session_ctx: ContextVar[AsyncSession] = ContextVar("db_session")
+
+
+class DBSessionMiddleware:
+    """ASGI middleware managing a database session for each HTTP request.
+
+    The session is created before the request is handled, made available
+    through current_session(), and closed after the response is sent.
+    It connects to the database lazily, so requests that don't use it
+    don't check out a connection.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with Session() as session:
+            token = _session_ctx.set(session)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _session_ctx.reset(token)
+
+
+def current_session() -> AsyncSession:
+    """Get the database session of the current request.
+
+    Returns:
+        AsyncSession: An async database session.
+
+    Raises:
+        LookupError: If called outside of a request handled by DBSessionMiddleware.
+    """
+    return _session_ctx.get()
@@ -4,7 +4,7 @@ This module defines the SQLAlchemy models used in the application.
 """
 
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String
+from sqlalchemy import String, column, table
 from db_config import Base
 
 
@@ -19,6 +19,12 @@ class Book(Base):
 
     __tablename__ = "books"
 
-    title: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    author: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    # title and author are searched through the books_fts trigram index
+    title: Mapped[str] = mapped_column(String(50), nullable=False)
+    author: Mapped[str] = mapped_column(String(50), nullable=False)
     year: Mapped[int] = mapped_column(nullable=True, index=True)
+
+
+# Trigram FTS5 index over books' title and author, kept in sync by triggers.
+# Declared as a lightweight table, so it's not a part of the models metadata
+books_fts = table("books_fts", column("rowid"), column("title"), column("author"))
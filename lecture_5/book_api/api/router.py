@@ -4,10 +4,11 @@ This module defines all the endpoints for managing books.
 """
 
 from typing import Annotated, Literal
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import ORJSONResponse
+from api.models import Book
 from api.schemas import BooksListSerializer, BookSchema, BookSerializer
-from api.session_dep import SessionDep
+from api.db_session import current_session
 from api.db_service import book_service, BookDoesNotExistException
 import api.schemas
 
@@ -16,24 +17,54 @@ router = APIRouter(prefix="/books", tags=["Books"])
 PaginationQuery = Annotated[api.schemas.PaginationQuery, Query()]
 
 
-@router.get(path="/", name="Get all books")
-async def get(session: SessionDep, pagination: PaginationQuery) -> BooksListSerializer:
+async def book_does_not_exist_handler(
+    _request: Request, _exc: BookDoesNotExistException
+) -> ORJSONResponse:
+    """Convert BookDoesNotExistException raised in any endpoint to 404 response.
+
+    Registered on the application, so endpoints don't need their own try/except.
+
+    Returns:
+        A 404 response with the same body as HTTPException(status_code=404).
+    """
+    return ORJSONResponse({"detail": "Not Found"}, status_code=404)
+
+
+def book_response(book: Book) -> ORJSONResponse:
+    """Build a response with a single book.
+
+    The book is already valid, so it's dumped by orjson without a Pydantic model.
+
+    Args:
+        book: The book to return.
+
+    Returns:
+        A response with the book's fields.
+    """
+    return ORJSONResponse(
+        {"id": book.id, "title": book.title, "author": book.author, "year": book.year}
+    )
+
+
+@router.get(
+    path="/",
+    response_model=None,
+    responses={200: {"model": BooksListSerializer}},
+    name="Get all books",
+)
+async def get(pagination: PaginationQuery) -> ORJSONResponse:
     """Get a paginated list of all the books.
 
     Args:
-        session: Database session dependency.
         pagination: Pagination parameters (cursor and limit).
 
     Returns:
         A paginated list of books.
     """
-    books = await book_service.get(session=session, pagination=pagination)
+    books = await book_service.get(session=current_session(), pagination=pagination)
 
-    return JSONResponse(
-        BooksListSerializer.model_validate(
-            {"items": books}, from_attributes=True
-        ).model_dump()
-    )
+    # Rows from the database are already valid, so Pydantic validation is skipped
+    return ORJSONResponse({"items": [dict(book) for book in books]})
 
 
 class SearchRouteQueryParams(api.schemas.PaginationQuery, api.schemas.SearchBookQuery):
@@ -45,60 +76,64 @@ class SearchRouteQueryParams(api.schemas.PaginationQuery, api.schemas.SearchBook
     """
 
 
-@router.get(path="/search/", name="Search books by title, author, or year")
+@router.get(
+    path="/search/",
+    response_model=None,
+    responses={200: {"model": BooksListSerializer}},
+    name="Search books by title, author, or year",
+)
 async def search(
-    session: SessionDep, query_params: Annotated[SearchRouteQueryParams, Query()]
-) -> BooksListSerializer:
+    query_params: Annotated[SearchRouteQueryParams, Query()],
+) -> ORJSONResponse:
     """Search for books by title, author, or year with pagination.
 
     Args:
-        session: Database session dependency.
         query_params: Combined search and pagination parameters.
 
     Returns:
        A paginated list of matching books.
     """
     books = await book_service.search(
-        session=session, search_params=query_params, pagination=query_params
+        session=current_session(), search_params=query_params, pagination=query_params
     )
 
-    return JSONResponse(
-        BooksListSerializer.model_validate(
-            {"items": books}, from_attributes=True
-        ).model_dump()
-    )
+    # Rows from the database are already valid, so Pydantic validation is skipped
+    return ORJSONResponse({"items": [dict(book) for book in books]})
 
 
-@router.post(path="/", name="Add a new book")
-async def create(session: SessionDep, payload: BookSchema) -> BookSerializer:
+@router.post(
+    path="/",
+    response_model=None,
+    responses={200: {"model": BookSerializer}},
+    name="Add a new book",
+)
+async def create(payload: BookSchema) -> ORJSONResponse:
     """Create a new book in the database.
 
     Args:
-        session: Database session dependency.
         payload: Book data to create.
 
     Returns:
         The created book with its assigned ID.
     """
-    book = await book_service.create(session, payload)
+    book = await book_service.create(current_session(), payload)
 
-    return JSONResponse(
-        BookSerializer.model_validate(book, from_attributes=True).model_dump()
-    )
+    return book_response(book)
 
 
 @router.put(
     path="/{book_id}",
-    responses={404: {"description": "in case if book does not exist"}},
+    response_model=None,
+    responses={
+        200: {"model": BookSerializer},
+        404: {"description": "in case if book does not exist"},
+    },
     name="Update book details",
 )
-async def update(
-    session: SessionDep, book_id: int, payload: BookSchema
-) -> BookSerializer:
+async def update(book_id: int, payload: BookSchema) -> ORJSONResponse:
     """Update an existing book's details.
 
     Args:
-        session: Database session dependency.
         book_id: The ID of the book to update.
         payload: Book data to update.
 
@@ -106,16 +141,11 @@ async def update(
         The updated book.
 
     Raises:
-        HTTPException: 404 if the book does not exist.
+        BookDoesNotExistException: If the book does not exist, handled as 404.
     """
-    try:
-        book = await book_service.update(session, book_id, payload)
-    except BookDoesNotExistException as exc:
-        raise HTTPException(status_code=404) from exc
+    book = await book_service.update(current_session(), book_id, payload)
 
-    return JSONResponse(
-        BookSerializer.model_validate(book, from_attributes=True).model_dump()
-    )
+    return book_response(book)
 
 
 @router.delete(
@@ -123,22 +153,18 @@ async def update(
     responses={404: {"description": "in case if book does not exist"}},
     name="Delete a book by ID",
 )
-async def delete(session: SessionDep, book_id: int) -> Literal[True]:
+async def delete(book_id: int) -> Literal[True]:
     """Delete a book from the database.
 
     Args:
-        session: Database session dependency.
         book_id: The ID of the book to delete.
 
     Returns:
         True if the deleting was successful.
 
     Raises:
-        HTTPException: 404 if the book does not exist.
+        BookDoesNotExistException: If the book does not exist, handled as 404.
     """
-    try:
-        await book_service.delete(session=session, book_id=book_id)
-    except BookDoesNotExistException as exc:
-        raise HTTPException(status_code=404) from exc
+    await book_service.delete(session=current_session(), book_id=book_id)
 
     return True
@@ -3,6 +3,8 @@
 This module sets up the SQLAlchemy async engine, session maker, and base model class.
 """
 
+import os
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
@@ -20,7 +22,33 @@ DB_NAME: str = "book_collection.db"
 
 DB_URL: str = f"sqlite+aiosqlite:///{DB_NAME}"
 
-engine = create_async_engine(DB_URL, echo=True)
+# SQL logging formats every statement on the request path, so it is off by default
+DEBUG: bool = os.getenv("APP_DEBUG") == "1"
 
+# The default queue pool is kept on purpose: SQLite serializes writes anyway,
+# and NullPool would open a new connection and rerun the pragmas on every request
+engine = create_async_engine(DB_URL, echo=DEBUG)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune SQLite settings for every new pooled connection.
+
+    WAL journal lets readers work concurrently with a writer, and NORMAL
+    synchronous mode is safe with WAL while syncing to disk less often.
+
+    Args:
+        dbapi_connection: The raw DBAPI connection.
+        _connection_record: The pool's connection record (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+# Instances are not expired on commit, so written rows don't need to be reloaded
 # pylint: disable=<invalid-name>
-Session = async_sessionmaker(engine)
+Session = async_sessionmaker(engine, expire_on_commit=False)
@@ -4,12 +4,17 @@ This module creates and configures the FastAPI application instance.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
-from api.router import router as book_router
+from api.db_service import BookDoesNotExistException
+from api.router import book_does_not_exist_handler, router as book_router
+from api.db_session import DBSessionMiddleware
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(book_router)
+app.add_exception_handler(BookDoesNotExistException, book_does_not_exist_handler)
+app.add_middleware(DBSessionMiddleware)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", reload=True)
@@ -3,12 +3,35 @@
 This module defines request and response schemas used for data validation and serialization.
 """
 
-from typing import Annotated, List
+from typing import Annotated, Any, List
 from datetime import datetime
+import time
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic import ConfigDict
 
 
+# Cached current year and the timestamp when it ends.
+# The year is recomputed only once the next year has started
+_YEAR_END: float = 0.0
+_YEAR: int = 0
+
+
+def get_current_year() -> int:
+    """Get the current year, recomputing it only when the cached one has ended.
+
+    Returns:
+        The current year.
+    """
+    global _YEAR_END, _YEAR  # pylint: disable=global-statement
+
+    if time.time() >= _YEAR_END:
+        now = datetime.now()
+        _YEAR_END = datetime(now.year + 1, 1, 1).timestamp()
+        _YEAR = now.year
+
+    return _YEAR
+
+
 class YearField:
     """Mixin class providing year field validation.
 
@@ -31,7 +54,7 @@ class YearField:
         Raises:
             ValueError: If the year is in the future.
         """
-        if year_value is not None and year_value > datetime.now().year:
+        if year_value is not None and year_value > get_current_year():
             raise ValueError("Year cannot be in the future")
         return year_value
 
@@ -69,20 +92,32 @@ class SearchBookQuery(BaseModel, YearField):
     title: Annotated[str, Field(min_length=1, examples=["Book Title"])] = None
     author: Annotated[str, Field(min_length=1, examples=["Book Author"])] = None
 
-    @model_validator(mode="after")
-    def check_search_parameter(self):
+    @model_validator(mode="before")
+    @classmethod
+    def check_search_parameter(cls, data: Any) -> Any:
         """Validate that at least one search parameter is provided.
 
+        Runs on the raw input, so a query without parameters is rejected
+        before the fields are validated.
+
+        Args:
+            data: The raw input data.
+
         Returns:
-            The validated model instance.
+            The unchanged input data.
 
         Raises:
             ValueError: If no search parameters are provided.
         """
-        if self.author is None and self.title is None and self.year is None:
+        if (
+            isinstance(data, dict)
+            and data.get("title") is None
+            and data.get("author") is None
+            and data.get("year") is None
+        ):
             raise ValueError("Enter at least one search parameter")
 
-        return self
+        return data
 
 
 class PaginationQuery(BaseModel):
@@ -90,11 +125,11 @@ class PaginationQuery(BaseModel):
 
     Attributes:
         cursor: Optional cursor for pagination (ID of the last item from previous page).
-        limit: Maximum number of items to return (default: 12, minimum: 1).
+        limit: Maximum number of items to return (default: 12, minimum: 1, maximum: 100).
     """
 
     cursor: int | None = None
-    limit: Annotated[int, Field(ge=1, default=12)]
+    limit: Annotated[int, Field(ge=1, le=100, default=12)]
 
 
 class BooksListSerializer(BaseModel):
@@ -1,11 +1,24 @@
 """FastAPI application with health check endpoint."""
 
+import os
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
-from api.router import router as book_router
+from api.db_service import BookDoesNotExistException
+from api.router import book_does_not_exist_handler, router as book_router
+from api.db_session import DBSessionMiddleware
 
-app = FastAPI()
+# API docs are not served in production, so their routes aren't even registered
+docs_urls = (
+    {"openapi_url": None, "docs_url": None, "redoc_url": None}
+    if os.getenv("ENV") == "prod"
+    else {}
+)
+
+app = FastAPI(default_response_class=ORJSONResponse, **docs_urls)
 app.include_router(book_router)
+app.add_exception_handler(BookDoesNotExistException, book_does_not_exist_handler)
+app.add_middleware(DBSessionMiddleware)
 
 @app.get("/healthcheck")
 async def healthcheck() -> dict:
@@ -14,4 +27,9 @@ async def healthcheck() -> dict:
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", reload=True, port=8000)
+    # Reloading watches the source tree, so it's only enabled for development with DEV=1
+    dev_mode = os.getenv("DEV") == "1"
+
+    # Every worker opens its own pool on the same SQLite file, so uvicorn's default
+    # of a single worker is kept; it can be raised with WEB_CONCURRENCY
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=dev_mode)
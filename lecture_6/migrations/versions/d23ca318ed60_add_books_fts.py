@@ -0,0 +1,54 @@
+"""add books fts
+
+Revision ID: d23ca318ed60
+Revises: 971d2ecc3e38
+Create Date: 2026-10-15 17:54:10.698422
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd23ca318ed60'
+down_revision: Union[str, Sequence[str], None] = '971d2ecc3e38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FTS5 trigram index lets LIKE '%text%' searches use an index instead of a table scan
+    op.execute(
+        "CREATE VIRTUAL TABLE books_fts USING fts5("
+        "title, author, content='books', content_rowid='id', tokenize='trigram')"
+    )
+    op.execute(
+        "CREATE TRIGGER books_fts_ai AFTER INSERT ON books BEGIN "
+        "INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER books_fts_ad AFTER DELETE ON books BEGIN "
+        "INSERT INTO books_fts(books_fts, rowid, title, author) "
+        "VALUES ('delete', old.id, old.title, old.author); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER books_fts_au AFTER UPDATE ON books BEGIN "
+        "INSERT INTO books_fts(books_fts, rowid, title, author) "
+        "VALUES ('delete', old.id, old.title, old.author); "
+        "INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author); "
+        "END"
+    )
+    op.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER books_fts_au")
+    op.execute("DROP TRIGGER books_fts_ad")
+    op.execute("DROP TRIGGER books_fts_ai")
+    op.execute("DROP TABLE books_fts")